@@ -46,7 +46,14 @@ def main():
     Returns:
         int: Exit code from the async main function.
     """
-    return asyncio.run(main_async())
+    # Use uvloop's faster event loop when the optional `speedups` extra is installed
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    
+    return asyncio.run(main_async(), loop_factory=loop_factory)
 
 if __name__ == "__main__":
     # Run the application
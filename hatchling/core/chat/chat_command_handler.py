@@ -4,6 +4,7 @@ This module provides a central handler for all chat commands by combining
 base commands and Hatch-specific commands into a unified interface.
 """
 
+import asyncio
 import logging
 from typing import Tuple, Optional
 
@@ -19,6 +20,16 @@ from hatch import HatchEnvironmentManager
 
 class ChatCommandHandler:
     """Handles processing of command inputs in the chat interface."""    
+    
+    # Synchronous Hatch environment and package handlers that do blocking disk and
+    # network work. Only these run in a worker thread; the other handlers are quick or
+    # change chat, settings or logging state, so they stay on the event loop.
+    _BLOCKING_COMMANDS = frozenset({
+        'hatch:env:list', 'hatch:env:create', 'hatch:env:remove',
+        'hatch:pkg:add', 'hatch:pkg:remove', 'hatch:pkg:list',
+        'hatch:create', 'hatch:validate',
+    })
+    
     def __init__(self, chat_session, settings: ChatSettings, env_manager: HatchEnvironmentManager, debug_log: SessionDebugLog, style: Optional[Style] = None):
         """Initialize the command handler.
         
@@ -92,6 +103,9 @@ class ChatCommandHandler:
         # Check if the input is a registered command
         if command in self.sync_commands:
             handler_func, _ = self.sync_commands[command]
+            if command in self._BLOCKING_COMMANDS:
+                # Keep the event loop responsive while Hatch works
+                return True, await asyncio.to_thread(handler_func, args)
             return True, handler_func(args)
         elif command in self.async_commands:
             async_handler_func, _ = self.async_commands[command]
@@ -103,6 +117,9 @@ class ChatCommandHandler:
     def get_all_command_metadata(self) -> dict:
         """Get all command metadata from both command handlers.
         
+        The metadata is combined once in _register_commands, so this is a plain
+        lookup that can be called freely (e.g. by the lexer and completer).
+        
         Returns:
             dict: Combined command metadata from base and hatch commands.
         """
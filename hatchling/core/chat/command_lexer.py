@@ -14,6 +14,22 @@ from prompt_toolkit.document import Document
 class ChatCommandLexer(Lexer):
     """Custom lexer for highlighting chat commands in real-time."""
     
+    # Map token types to CSS classes
+    _STYLE_MAP = {
+        'command.base': 'class:command.name.base',
+        'command.hatch': 'class:command.name.hatch',
+        'command': 'class:command.name',  # Fallback for generic commands
+        'argument.base': 'class:command.args.base',
+        'argument.hatch': 'class:command.args.hatch',
+        'argument.invalid': 'class:command.args.invalid',
+        'value.path': 'class:command.value.path',
+        'value.number': 'class:command.value.number',
+        'value.string': 'class:command.value.string',
+        'value.generic': 'class:command.value.generic',
+        'whitespace': '',
+        'text': 'class:text.default',
+    }
+    
     def __init__(self, command_metadata: Dict[str, Dict[str, Any]]):
         """Initialize the lexer with command metadata.
         
@@ -44,7 +60,8 @@ class ChatCommandLexer(Lexer):
         def get_tokens(line_number: int):
             # Get the line content
             try:
-                lines = document.text.split('\n')
+                # Document caches its split lines, so this is not redone for every line
+                lines = document.lines
                 if line_number >= len(lines):
                     return []
                 
@@ -226,20 +243,4 @@ class ChatCommandLexer(Lexer):
         Returns:
             CSS style class name.
         """
-        # Map token types to CSS classes
-        style_map = {
-            'command.base': 'class:command.name.base',
-            'command.hatch': 'class:command.name.hatch',
-            'command': 'class:command.name',  # Fallback for generic commands
-            'argument.base': 'class:command.args.base',
-            'argument.hatch': 'class:command.args.hatch',
-            'argument.invalid': 'class:command.args.invalid',
-            'value.path': 'class:command.value.path',
-            'value.number': 'class:command.value.number',
-            'value.string': 'class:command.value.string',
-            'value.generic': 'class:command.value.generic',
-            'whitespace': '',
-            'text': 'class:text.default',
-        }
-        
-        return style_map.get(token_type, '')
+        return self._STYLE_MAP.get(token_type, '')
@@ -0,0 +1,121 @@
+"""Persistent input history for the chat prompt.
+
+This module provides prompt_toolkit history classes that keep the history file
+bounded, so loading it at startup does not grow with months of use, and that
+keep disk writes off the event loop thread.
+"""
+
+import asyncio
+import datetime
+import os
+from collections import deque
+from typing import Deque, List, Optional
+
+from prompt_toolkit.history import FileHistory
+
+
+class BoundedFileHistory(FileHistory):
+    """File history that keeps only the most recent entries on disk."""
+
+    def __init__(self, filename: str, max_entries: int = 500):
+        """Initialize the history, truncating the file to its last entries.
+
+        Args:
+            filename (str): Path to the history file.
+            max_entries (int, optional): Number of entries to keep. Defaults to 500.
+        """
+        super().__init__(filename)
+        self.max_entries = max_entries
+        self._truncate()
+
+    def _truncate(self) -> None:
+        """Rewrite the history file with only its last `max_entries` entries.
+
+        Each entry starts with a '# <timestamp>' line followed by '+<text>' lines,
+        so the file is cut on an entry boundary. Failures leave the file untouched.
+        """
+        try:
+            if not os.path.exists(self.filename):
+                return
+
+            with open(self.filename, "rb") as f:
+                lines = f.readlines()
+
+            entry_starts = [i for i, line in enumerate(lines) if line.startswith(b"#")]
+            if len(entry_starts) <= self.max_entries:
+                return
+
+            # Write to a temporary file first so an interruption never loses the history
+            tmp_filename = f"{self.filename}.tmp"
+            with open(tmp_filename, "wb") as f:
+                f.write(b"\n")
+                f.writelines(lines[entry_starts[-self.max_entries]:])
+            os.replace(tmp_filename, self.filename)
+        except OSError:
+            pass
+
+
+class AsyncBufferedFileHistory(BoundedFileHistory):
+    """Bounded file history whose writes are batched and done in a worker thread."""
+
+    def __init__(self, filename: str, max_entries: int = 500):
+        """Initialize the history.
+
+        Args:
+            filename (str): Path to the history file.
+            max_entries (int, optional): Number of entries to keep. Defaults to 500.
+        """
+        super().__init__(filename, max_entries)
+        self._pending: Deque[str] = deque()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def store_string(self, string: str) -> None:
+        """Queue an entry to be appended to the history file.
+
+        Args:
+            string (str): The entry to store.
+        """
+        self._pending.append(string)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (synchronous prompt): write through
+            self._append_batch(self._take_pending())
+            return
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flusher())
+
+    async def flush(self) -> None:
+        """Wait until every queued entry has been written to disk."""
+        if self._flush_task is not None:
+            await self._flush_task
+
+    async def _flusher(self) -> None:
+        """Write queued entries in batches until the queue is empty."""
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            try:
+                await loop.run_in_executor(None, self._append_batch, self._take_pending())
+            except Exception:
+                # History is a convenience: drop the batch rather than disturb the chat,
+                # whether the file is unwritable or an entry cannot be encoded
+                pass
+
+    def _take_pending(self) -> List[str]:
+        """Remove and return all queued entries."""
+        batch = list(self._pending)
+        self._pending.clear()
+        return batch
+
+    def _append_batch(self, batch: List[str]) -> None:
+        """Append entries to the history file, in the format used by FileHistory.
+
+        Args:
+            batch (List[str]): Entries to append, oldest first.
+        """
+        with open(self.filename, "ab") as f:
+            for string in batch:
+                lines = [f"\n# {datetime.datetime.now()}\n"]
+                lines.extend(f"+{line}\n" for line in string.split("\n"))
+                f.write("".join(lines).encode("utf-8"))
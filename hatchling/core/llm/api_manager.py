@@ -1,7 +1,9 @@
 import json
-from typing import List, Dict, Tuple, Any
+from typing import List, Dict, Tuple, Any, Optional
 import logging
 import aiohttp
+from prompt_toolkit import print_formatted_text
+from prompt_toolkit.formatted_text import FormattedText
 from hatchling.core.logging.logging_manager import logging_manager
 from hatchling.config.settings import ChatSettings
 from hatchling.core.chat.message_history import MessageHistory
@@ -86,6 +88,21 @@ class APIManager:
         """
         return "message" in data and "content" in data["message"]
     
+    def _print_chunk(self, content: str, inline_prefix: Optional[FormattedText] = None) -> None:
+        """Print a chunk of streamed output, preceded by a pending styled prefix if any.
+        
+        The prefix and the chunk are written in a single call, sparing the prefix
+        its own flushed write.
+        
+        Args:
+            content: The text to print.
+            inline_prefix: Optional styled prefix to print before the text.
+        """
+        if inline_prefix:
+            print_formatted_text(FormattedText([*inline_prefix, ('', content)]), end="", flush=True)
+        else:
+            print(content, end="", flush=True)
+    
     async def process_response_data(self,
                                     data: Dict[str, Any],
                                     message_tool_calls: List,
@@ -125,7 +142,8 @@ class APIManager:
                               tool_executor,
                               print_output: bool = True,
                               prefix: str = None,
-                              update_history: bool = True) -> Tuple[str, List, List]:
+                              update_history: bool = True,
+                              inline_prefix: Optional[FormattedText] = None) -> Tuple[str, List, List]:
         """Stream a response from the API and handle common processing.
         
         Args:
@@ -136,6 +154,7 @@ class APIManager:
             print_output: Whether to print the output to the console
             prefix: Optional prefix to print before the response.
             update_history: Whether to update message history with the response.
+            inline_prefix: Optional styled prefix printed together with the first output.
             
         Returns:
             Tuple containing (full_response, message_tool_calls, tool_results).
@@ -168,6 +187,11 @@ class APIManager:
                     # Parse the JSON response
                     data = json.loads(line_text)
                     
+                    # Tool calls log their own output, so emit a pending prefix first
+                    if inline_prefix and print_output and self.has_tool_calls(data):
+                        self._print_chunk("", inline_prefix)
+                        inline_prefix = None
+                    
                     # Process the response data
                     content, current_tool_results = await self.process_response_data(data, message_tool_calls, tool_executor)
 
@@ -175,13 +199,14 @@ class APIManager:
                         tool_results.extend(current_tool_results)
                     elif content:
                         if print_output:
-                            print(content, end="", flush=True)
+                            self._print_chunk(content, inline_prefix)
+                            inline_prefix = None
                         full_response += content
                     
                     # Check if this is the last message
                     if data.get("done", False):
                         if print_output:
-                            print()  # Add a newline after completion
+                            self._print_chunk("\n", inline_prefix)  # Add a newline after completion
                         break
                     
                 except json.JSONDecodeError as e:
@@ -202,7 +227,8 @@ class APIManager:
                                       tool_executor,
                                       print_output: bool = True,
                                       prefix: str = None,
-                                      update_history: bool = True) -> Tuple[str, List, List]:
+                                      update_history: bool = True,
+                                      inline_prefix: Optional[FormattedText] = None) -> Tuple[str, List, List]:
         """Stream a response from the OpenAI API, supporting function calling."""
 
         full_response = ""
@@ -241,7 +267,8 @@ class APIManager:
                         chunk = chunk[len("data:"):].strip()
                     if chunk == "[DONE]":
                         if print_output:
-                            print()
+                            self._print_chunk("\n", inline_prefix)
+                            inline_prefix = None
                         break
 
                     try:
@@ -257,6 +284,9 @@ class APIManager:
                     # Handle function call (tool call)
                     if "function_call" in delta:
                         fc = delta["function_call"]
+                        if inline_prefix and print_output:
+                            self._print_chunk("", inline_prefix)
+                            inline_prefix = None
                         if function_call_accumulator is None:
                             function_call_accumulator = ""
                             function_call_name = fc.get("name")
@@ -269,7 +299,8 @@ class APIManager:
                     content_piece = delta.get("content")
                     if content_piece:
                         if print_output:
-                            print(content_piece, end="", flush=True)
+                            self._print_chunk(content_piece, inline_prefix)
+                            inline_prefix = None
                         full_response += content_piece
 
             # If a function call was accumulated, execute it
@@ -303,7 +334,8 @@ class APIManager:
                               tool_executor,
                               print_output: bool = True,
                               prefix: str = None,
-                              update_history: bool = True) -> Tuple[str, List, List]:
+                              update_history: bool = True,
+                              inline_prefix: Optional[FormattedText] = None) -> Tuple[str, List, List]:
         """Stream a response using the configured provider."""
 
         if self.settings.llm_provider == "openai":
@@ -312,6 +344,7 @@ class APIManager:
                 print_output=print_output,
                 prefix=prefix,
                 update_history=update_history,
+                inline_prefix=inline_prefix,
             )
 
         return await self._stream_ollama_response(
@@ -319,4 +352,5 @@ class APIManager:
             print_output=print_output,
             prefix=prefix,
             update_history=update_history,
+            inline_prefix=inline_prefix,
         )
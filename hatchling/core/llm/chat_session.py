@@ -2,6 +2,8 @@ import aiohttp
 import logging
 from typing import List, Dict, Tuple, Any, Optional
 
+from prompt_toolkit.formatted_text import FormattedText
+
 from hatchling.core.logging.session_debug_log import SessionDebugLog
 from hatchling.mcp_utils.manager import mcp_manager
 from hatchling.core.logging.logging_manager import logging_manager
@@ -43,12 +45,14 @@ class ChatSession:
         """
         return await self.tool_executor.initialize_mcp(server_paths)
     
-    async def send_message(self, user_message: str, session: aiohttp.ClientSession) -> str:
+    async def send_message(self, user_message: str, session: aiohttp.ClientSession,
+                           prefix: Optional[FormattedText] = None) -> str:
         """Send the current message history to the Ollama API and stream the response.
         
         Args:
             user_message (str): The user's message to process.
             session (aiohttp.ClientSession): The session to use for the request.
+            prefix (Optional[FormattedText]): Styled text printed with the first streamed output. Defaults to None.
             
         Returns:
             str: The assistant's response text.
@@ -67,7 +71,8 @@ class ChatSession:
         
         # Process the initial response
         full_response, message_tool_calls, tool_results = await self.api_manager.stream_response(
-            session, payload, self.history, self.tool_executor, print_output=True, update_history=True
+            session, payload, self.history, self.tool_executor, print_output=True, update_history=True,
+            inline_prefix=prefix
         )
         
         # Check if we have tool results that need further processing
@@ -5,7 +5,8 @@ and verifying the Ollama service status.
 """
 
 import json
-from typing import List, Tuple
+from contextlib import AsyncExitStack
+from typing import List, Optional, Tuple
 import aiohttp
 import os
 from hatchling.mcp_utils.ollama_adapter import OllamaMCPAdapter
@@ -64,64 +65,105 @@ class ModelManager:
         self.logger.info(f"Pulling model: {model_name}")
 
         try:
-            async with session.post(
-                f"{self.settings.ollama_api_url}/pull",
-                json={"name": model_name},
-                timeout=None  # No timeout for model downloading
-            ) as response:
-                if response.status != 200:
-                    text = await response.text()
-                    error_msg = f"Failed to pull model: {response.status}, {text}"
-                    self.logger.error(error_msg)
-                    raise Exception(error_msg)
-
-                self.logger.info(f"Started downloading {model_name}. This may take a while...")
-                async for line in response.content.iter_any():
-                    if line:
-                        try:
-                            line_text = line.decode('utf-8').strip()
-                            if not line_text:
-                                continue
-
-                            # Split by newlines to handle multiple JSON objects in one line
-                            json_objects = line_text.split('\n')
-                            for json_obj in json_objects:
-                                if not json_obj.strip():
-                                    continue
-
-                                try:
-                                    data = json.loads(json_obj)
-                                    if "status" in data:
-                                        print(f"Status: {data['status']}", flush=True)
-                                    if "completed" in data and "total" in data:
-                                        percentage = (data["completed"] / data["total"]) * 100
-                                        print(f"Progress: {percentage:.2f}%", flush=True)
-                                except json.JSONDecodeError:
-                                    self.logger.error(f"Received invalid JSON during model pull: {json_obj}")
-                                except Exception as e:
-                                    self.logger.error(f"Error processing model pull response: {e}\nData: {json_obj}")
-                        except Exception as e:
-                            self.logger.error(f"Error processing line: {e}")
-
-                self.logger.info(f"Download of {model_name} completed.")
+            if not await self._stream_pull(session, model_name):
+                raise Exception(f"Ollama did not report a successful pull of {model_name}")
+            self.logger.info(f"Download of {model_name} completed.")
         except Exception as e:
             error_msg = f"Error pulling model: {e}"
             self.logger.error(error_msg)
             raise Exception(error_msg)
 
-    async def check_ollama_service(self) -> Tuple[bool, str]:
+    async def ensure_model(self, session: aiohttp.ClientSession, model_name: str) -> bool:
+        """Make sure a model is available in Ollama, pulling it if necessary.
+
+        The local models are checked first, so startup neither waits on the registry nor
+        silently updates a model that is already available; the model is only pulled
+        when it is missing.
+
+        Args:
+            session (aiohttp.ClientSession): HTTP session to use for the requests to Ollama.
+            model_name (str): Name of the model to make available.
+
+        Returns:
+            bool: True once the model is available.
+
+        Raises:
+            Exception: If the available models could not be checked or the model could not be pulled.
+        """
+        if await self.check_availability(session, model_name):
+            self.logger.info(f"Model {model_name} is already pulled.")
+            return True
+
+        await self.pull_model(session, model_name)
+        return True
+
+    async def _stream_pull(self, session: aiohttp.ClientSession, model_name: str) -> bool:
+        """Send a pull request to Ollama and print its streamed progress.
+
+        Args:
+            session (aiohttp.ClientSession): HTTP session to use for the request to Ollama/pull.
+            model_name (str): Name of the model to pull.
+
+        Returns:
+            bool: True if Ollama reported the pull as successful, False otherwise.
+
+        Raises:
+            Exception: If Ollama rejected the pull request.
+        """
+        succeeded = False
+        async with session.post(
+            f"{self.settings.ollama_api_url}/pull",
+            json={"name": model_name},
+            timeout=None  # No timeout for model downloading
+        ) as response:
+            if response.status != 200:
+                text = await response.text()
+                raise Exception(f"Failed to pull model: {response.status}, {text}")
+
+            self.logger.info(f"Pulling {model_name}. This may take a while...")
+            # The response is a stream of JSON objects, one per line
+            async for line in response.content:
+                json_obj = line.decode('utf-8').strip()
+                if not json_obj:
+                    continue
+
+                try:
+                    data = json.loads(json_obj)
+                    if "error" in data:
+                        self.logger.error(f"Ollama failed to pull {model_name}: {data['error']}")
+                    if "status" in data:
+                        print(f"Status: {data['status']}", flush=True)
+                        succeeded = data["status"] == "success"
+                    if "completed" in data and "total" in data:
+                        percentage = (data["completed"] / data["total"]) * 100
+                        print(f"Progress: {percentage:.2f}%", flush=True)
+                except json.JSONDecodeError:
+                    self.logger.error(f"Received invalid JSON during model pull: {json_obj}")
+                except Exception as e:
+                    self.logger.error(f"Error processing model pull response: {e}\nData: {json_obj}")
+
+        return succeeded
+
+    async def check_ollama_service(self, session: Optional[aiohttp.ClientSession] = None) -> Tuple[bool, str]:
         """Asynchronously check if Ollama service is available.
 
         Effectively tries to get the version of the service with Ollama/version
         with a timeout of 5 seconds.
 
+        Args:
+            session (aiohttp.ClientSession, optional): HTTP session to use for the request, so its
+                connection to Ollama can be reused afterwards. Defaults to None, in which case a
+                temporary session is used.
+
         Returns:
             Tuple[bool, str]: A tuple containing:
                 - bool: Whether the service is available
                 - str: A descriptive message
         """
         try:
-            async with aiohttp.ClientSession() as session:
+            async with AsyncExitStack() as stack:
+                if session is None:
+                    session = await stack.enter_async_context(aiohttp.ClientSession())
                 async with session.get(f"{self.settings.ollama_api_url}/version", timeout=5) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -131,8 +173,16 @@ class ModelManager:
         except Exception as e:
             return False, f"Ollama service is not available: {e}"
 
-    async def check_openai_service(self) -> Tuple[bool, str]:
-        """Check if OpenAI API key is set and the model is available (via a test API call)."""
+    async def check_openai_service(self, session: Optional[aiohttp.ClientSession] = None) -> Tuple[bool, str]:
+        """Check if OpenAI API key is set and the model is available (via a test API call).
+
+        Args:
+            session (aiohttp.ClientSession, optional): HTTP session to use for the request. Defaults
+                to None, in which case a temporary session is used.
+
+        Returns:
+            Tuple[bool, str]: Whether the service is available, and a descriptive message.
+        """
         import aiohttp
         if not self.settings.openai_api_key:
             return False, "OpenAI API key is missing. Please set CHATGPT_API_KEY in your environment."
@@ -146,7 +196,9 @@ class ModelManager:
                 "messages": [{"role": "user", "content": "Hello"}],
                 "max_tokens": 1
             }
-            async with aiohttp.ClientSession() as session:
+            async with AsyncExitStack() as stack:
+                if session is None:
+                    session = await stack.enter_async_context(aiohttp.ClientSession())
                 async with session.post(f"{self.settings.openai_api_url}/chat/completions", json=payload, headers=headers, timeout=10) as response:
                     if response.status == 200:
                         return True, f"OpenAI service is available and model '{self.settings.openai_model}' is accessible."
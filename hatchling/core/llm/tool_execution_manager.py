@@ -95,12 +95,14 @@ class ToolExecutionManager:
             # Increment the tool call iteration counter each time a tool is executed
             self.current_tool_call_iteration += 1
             
-            # Format the tool call for the MCPManager
+            # Format the tool call for the MCPManager. Arguments are passed as they are:
+            # the adapter accepts dicts, and encoding them here only for the adapter to
+            # decode them again would serialize them twice more than needed.
             formatted_tool_call = {
                 "id": tool_id,
                 "function": {
                     "name": function_name,
-                    "arguments": json.dumps(arguments) if isinstance(arguments, dict) else arguments
+                    "arguments": arguments
                 }
             }
             
@@ -7,8 +7,10 @@ consistent formatting and styling.
 
 import sys
 import os
+import time
 import logging
-from typing import Optional, Dict, Any
+from contextlib import nullcontext
+from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
 
 from hatchling.core.logging.logging_manager import logging_manager
@@ -23,6 +25,54 @@ try:
 except ImportError:
     _has_prompt_toolkit = False
 
+# Whether a prompt is currently waiting for user input. Styled records only need
+# patch_stdout() to keep clear of the prompt while one is displayed.
+_prompt_active = False
+
+
+def set_prompt_active(active: bool) -> None:
+    """Record whether a prompt_toolkit prompt is currently waiting for input.
+    
+    Args:
+        active: True while a prompt is displayed, False otherwise
+    """
+    global _prompt_active
+    _prompt_active = active
+
+
+class CachedAsctimeFormatter(logging.Formatter):
+    """A formatter that formats the date and time of each second only once.
+    
+    Records logged within the same second reuse the cached timestamp, only the
+    milliseconds are formatted per record.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        """Initialize the formatter, accepting the same arguments as logging.Formatter."""
+        super().__init__(*args, **kwargs)
+        # (second, formatted timestamp), swapped as a whole so threads never see a torn pair
+        self._cached_time: Tuple[int, str] = (-1, '')
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Return the creation time of a record, as logging.Formatter does.
+        
+        Args:
+            record: The log record being formatted
+            datefmt: Optional strftime format of the date and time
+            
+        Returns:
+            str: The formatted creation time
+        """
+        second = int(record.created)
+        cached_second, timestamp = self._cached_time
+        if second != cached_second:
+            timestamp = time.strftime(datefmt or self.default_time_format, self.converter(record.created))
+            self._cached_time = (second, timestamp)
+        
+        if datefmt or not self.default_msec_format:
+            return timestamp
+        return self.default_msec_format % (timestamp, record.msecs)
+
 
 class StyledHandler(logging.StreamHandler):
     """A logging handler that can output styled logs if prompt_toolkit is available."""
@@ -48,6 +98,19 @@ class StyledHandler(logging.StreamHandler):
         """
         super().__init__()
         self.styles = styles or self.DEFAULT_STYLES
+        
+        # Styles indexed by levelno // 10 (NOTSET, DEBUG, ..., CRITICAL) for the emit hot path;
+        # custom levels fall in the bucket of the standard level just below them
+        self._style_by_bucket = tuple(
+            self.styles.get(bucket * 10, 'fg:white') for bucket in range(6)
+        )
+        
+        # One reusable single-fragment FormattedText per bucket. emit() runs under
+        # the handler lock, so filling them in place is safe.
+        self._ft_buffers = (
+            tuple(FormattedText([(style, '')]) for style in self._style_by_bucket)
+            if _has_prompt_toolkit else ()
+        )
         self.supports_styling = _has_prompt_toolkit and (force_styling or sys.stdout.isatty())
         
         if formatter:
@@ -61,18 +124,28 @@ class StyledHandler(logging.StreamHandler):
         Args:
             record: The log record to emit
         """
+        # Bail out before formatting or taking the prompt_toolkit stdout lock
+        if record.levelno < self.level:
+            return
+        
         try:
             msg = self.format(record)
             
             if self.supports_styling:
-                style = self.styles.get(record.levelno, 'fg:white')
+                bucket = min(max(record.levelno, 0) // 10, 5)
                 
-                # Format the message with prompt_toolkit styling
-                formatted_text = FormattedText([(style, msg)])
+                # Fill the level's reusable buffer with the styled message
+                formatted_text = self._ft_buffers[bucket]
+                formatted_text[0] = (self._style_by_bucket[bucket], msg)
                 
-                # Use patch_stdout to avoid interfering with input prompts
-                with patch_stdout():
-                    print_formatted_text(formatted_text)
+                # Use patch_stdout to avoid interfering with an active input prompt,
+                # keeping only the actual print inside it
+                try:
+                    with patch_stdout() if _prompt_active else nullcontext():
+                        print_formatted_text(formatted_text)
+                finally:
+                    # Don't keep the last message alive in the buffer
+                    formatted_text[0] = (self._style_by_bucket[bucket], '')
             else:
                 # Fall back to normal output when styling isn't available
                 stream = self.stream
@@ -123,8 +196,8 @@ def configure_logging(enable_styling: bool = True,
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
-    # Create default formatter
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    # Create default formatter, caching the timestamp since records come in bursts
+    formatter = CachedAsctimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     
     # Set up console output with optional styling
     console_handler = StyledHandler(
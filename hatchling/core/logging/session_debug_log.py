@@ -37,50 +37,76 @@ class SessionDebugLog:
         # Keep track of log entries for easy access by index
         self.log_entries = []
     
-    def debug(self, message: str):
+    def _record(self, level: int, message: str, args: tuple):
+        """Keep a formatted copy of a log entry.
+        
+        Plain messages are always kept. Messages with placeholders are only formatted,
+        and kept, if their level is enabled; they are formatted right away, so later
+        changes to the arguments do not alter the entry.
+        
+        Args:
+            level (int): Logging level of the entry.
+            message (str): The message to log, optionally with %-style placeholders.
+            args (tuple): Values for the placeholders.
+        """
+        if args:
+            if not self.logger.isEnabledFor(level):
+                return
+            try:
+                message = message % args
+            except (TypeError, ValueError):
+                message = f"{message} {args}"
+        self.log_entries.append((datetime.now(), logging.getLevelName(level), message))
+    
+    def debug(self, message: str, *args):
         """Log a debug message.
         
         Args:
-            message (str): The message to log.
+            message (str): The message to log, optionally with %-style placeholders.
+            *args: Values for the placeholders, formatted only if the level is enabled.
         """
-        self.logger.debug(message)
-        self.log_entries.append((datetime.now().strftime("%Y-%m-%d %H:%M:%S:%f"), "DEBUG", message))
+        self.logger.debug(message, *args)
+        self._record(logging.DEBUG, message, args)
     
-    def info(self, message: str):
+    def info(self, message: str, *args):
         """Log an info message.
         
         Args:
-            message (str): The message to log.
+            message (str): The message to log, optionally with %-style placeholders.
+            *args: Values for the placeholders, formatted only if the level is enabled.
         """
-        self.logger.info(message)
-        self.log_entries.append((datetime.now().strftime("%Y-%m-%d %H:%M:%S:%f"), "INFO", message))
+        self.logger.info(message, *args)
+        self._record(logging.INFO, message, args)
     
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         """Log a warning message.
         
         Args:
-            message (str): The message to log.
+            message (str): The message to log, optionally with %-style placeholders.
+            *args: Values for the placeholders, formatted only if the level is enabled.
         """
-        self.logger.warning(message)
-        self.log_entries.append((datetime.now().strftime("%Y-%m-%d %H:%M:%S:%f"), "WARNING", message))
+        self.logger.warning(message, *args)
+        self._record(logging.WARNING, message, args)
     
-    def error(self, message: str):
+    def error(self, message: str, *args):
         """Log an error message.
         
         Args:
-            message (str): The message to log.
+            message (str): The message to log, optionally with %-style placeholders.
+            *args: Values for the placeholders, formatted only if the level is enabled.
         """
-        self.logger.error(message)
-        self.log_entries.append((datetime.now().strftime("%Y-%m-%d %H:%M:%S:%f"), "ERROR", message))
+        self.logger.error(message, *args)
+        self._record(logging.ERROR, message, args)
     
-    def critical(self, message: str):
+    def critical(self, message: str, *args):
         """Log a critical message.
         
         Args:
-            message (str): The message to log.
+            message (str): The message to log, optionally with %-style placeholders.
+            *args: Values for the placeholders, formatted only if the level is enabled.
         """
-        self.logger.critical(message)
-        self.log_entries.append((datetime.now().strftime("%Y-%m-%d %H:%M:%S:%f"), "CRITICAL", message))
+        self.logger.critical(message, *args)
+        self._record(logging.CRITICAL, message, args)
     
     def get_logs(self, last_n: Optional[int] = None) -> str:
         """Get formatted log entries, optionally limited to the last N entries.
@@ -100,7 +126,7 @@ class SessionDebugLog:
         
         result = f"=== SESSION DEBUG LOG: {self.name} ===\n"
         for time, level, message in entries:
-            result += f"[{time}] {level}: {message}\n"
+            result += f"[{time.strftime('%Y-%m-%d %H:%M:%S:%f')}] {level}: {message}\n"
         result += "======================\n"
         return result
     
@@ -1,17 +1,29 @@
 import os
+import math
+import time
+import random
 import asyncio
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import uuid
 from contextlib import AsyncExitStack
 
-from mcp import ClientSession, StdioServerParameters
+from mcp import ClientSession, StdioServerParameters, types
 from mcp.client.stdio import stdio_client
 from hatchling.core.logging.logging_manager import logging_manager
 
+# Environment of the MCP server processes, snapshotted once instead of copied on every
+# connection. Only read when spawning servers; see MCPClient.refresh_env().
+_DEFAULT_ENV: Dict[str, str] = os.environ.copy()
+
 
 class MCPClient:
     """Client for MCP servers that manages connections and tool execution."""
+    
+    # Citations and tools of each server script, shared by all clients and keyed by _cache_key()
+    _CITATION_CACHE: Dict[Tuple[str, float], Dict[str, str]] = {}
+    _TOOL_CACHE: Dict[Tuple[str, float], Dict[str, types.Tool]] = {}
+    
     def __init__(self):
         """Initialize the MCP client."""
         self.client_id = str(uuid.uuid4())
@@ -32,12 +44,33 @@ class MCPClient:
         # Add connection monitoring
         self._heartbeat_task = None
         self._reconnection_attempts = 0
-        self.MAX_RECONNECTION_ATTEMPTS = 3
-        self.RECONNECTION_DELAY = 2  # seconds
+        self.reconnecting = False  # True while the heartbeat tries to restore a lost connection
+        self.MAX_RECONNECTION_ATTEMPTS = 10
+        self.RECONNECTION_DELAY = 2  # seconds, doubled after each failed attempt
+        self.MAX_RECONNECTION_DELAY = 60  # seconds
+        
+        # Heartbeat interval, growing as the connection stays idle
+        self.HEARTBEAT_BASE_INTERVAL = 30  # seconds, right after a tool call
+        self.HEARTBEAT_MAX_INTERVAL = 300  # seconds
+        self.HEARTBEAT_IDLE_STEP = 30  # seconds of idleness per doubling of the interval
+        # Heartbeats only check the transport locally, and ping the server when it has
+        # been idle this long or on every HEARTBEAT_PING_CYCLES-th heartbeat
+        self.HEARTBEAT_PING_IDLE = 60  # seconds
+        self.HEARTBEAT_PING_CYCLES = 6
+        self._last_activity = time.monotonic()
         
         # Get a debug log session from the LoggingManager
         self.logger = logging_manager.get_session(self.__class__.__name__,
                                   formatter=logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    @staticmethod
+    def refresh_env() -> None:
+        """Update the environment given to MCP servers with the current process environment.
+        
+        Only needed if os.environ was modified after this module was imported.
+        """
+        _DEFAULT_ENV.clear()
+        _DEFAULT_ENV.update(os.environ)
+
     async def connect(self, server_path: str) -> bool:
         """Connect to an MCP server via stdio.
         
@@ -67,14 +100,66 @@ class MCPClient:
     def _start_heartbeat(self):
         """Start a background task to periodically check connection health."""
         if self._heartbeat_task is None:
-            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+            # Started eagerly: runs up to its first sleep right away instead of on the next loop iteration
+            self._heartbeat_task = asyncio.eager_task_factory(
+                asyncio.get_running_loop(),
+                self._heartbeat_loop(),
+                name=f"mcp_heartbeat_{self.client_id[:8]}"
+            )
+    def _next_heartbeat_interval(self) -> float:
+        """Compute the time to wait before the next heartbeat.
+        
+        The interval doubles each time the idle time since the last tool call crosses
+        a power of two of HEARTBEAT_IDLE_STEP, up to HEARTBEAT_MAX_INTERVAL.
+        
+        Returns:
+            float: Seconds until the next heartbeat.
+        """
+        idle = time.monotonic() - self._last_activity
+        interval = min(
+            self.HEARTBEAT_MAX_INTERVAL,
+            self.HEARTBEAT_BASE_INTERVAL * 2 ** math.floor(math.log2(1 + idle / self.HEARTBEAT_IDLE_STEP))
+        )
+        # Jitter so that the heartbeats of clients connected together do not line up
+        return interval * random.uniform(0.9, 1.1)
+    
+    def _transport_closed(self) -> bool:
+        """Check locally, without a round-trip, whether the server closed the transport.
+        
+        stdio_client closes the sending end of the read stream once the server's stdout
+        reaches end of file, which is what happens when the server process exits.
+        
+        Returns:
+            bool: True if the server can no longer send messages.
+        """
+        try:
+            return self.read.statistics().open_send_streams == 0
+        except AttributeError:
+            # No transport, or one that does not expose its statistics
+            return False
+    
     async def _heartbeat_loop(self):
         """Periodically check if the connection is still alive."""
+        cycle = 0
         try:
             while self.connected:
-                await asyncio.sleep(30)  # Check every 30 seconds
+                await asyncio.sleep(self._next_heartbeat_interval())
                 if not self.connected:
                     break
+                
+                # A server whose process has exited is detected without any request
+                if self._transport_closed():
+                    self.logger.warning("Connection heartbeat failed: the MCP server closed the connection")
+                    if not await self._reconnect():
+                        break
+                    continue
+                
+                # Recent tool calls already show the server responds, so ping only
+                # an idle connection, or every few heartbeats
+                cycle += 1
+                idle = time.monotonic() - self._last_activity
+                if idle < self.HEARTBEAT_PING_IDLE and cycle % self.HEARTBEAT_PING_CYCLES:
+                    continue
                     
                 try:
                     # Try a lightweight operation to check connection
@@ -83,11 +168,8 @@ class MCPClient:
                         self.logger.debug("Connection heartbeat: OK")
                 except Exception as e:
                     self.logger.warning(f"Connection heartbeat failed: {e}")
-                    # Mark as disconnected without trying to reconnect
-                    # This avoids task/context issues
-                    self.logger.warning("Connection marked as failed - client needs to be reconnected")
-                    self.connected = False
-                    break
+                    if not await self._reconnect():
+                        break
                     
         except asyncio.CancelledError:
             self.logger.debug("Heartbeat task cancelled")
@@ -97,13 +179,48 @@ class MCPClient:
             self.logger.debug("Heartbeat task stopped")
             self._heartbeat_task = None # _cleanup_connection has been replaced by _internal_cleanup in the connection manager
     
+    async def _reconnect(self) -> bool:
+        """Reconnect to the server after a failed heartbeat.
+        
+        The connection goes through the connection manager task like any other, so the
+        transport is still opened and closed from the same task. Attempts are spaced by
+        a capped exponential backoff with jitter, so that clients whose servers failed
+        together do not respawn them in lockstep.
+        
+        Returns:
+            bool: True if the connection was restored, False once all attempts failed.
+        """
+        self.connected = False
+        self.reconnecting = True
+        
+        try:
+            while self._reconnection_attempts < self.MAX_RECONNECTION_ATTEMPTS:
+                delay = min(self.MAX_RECONNECTION_DELAY, self.RECONNECTION_DELAY * 2 ** self._reconnection_attempts)
+                delay *= random.uniform(0.5, 1.5)
+                self._reconnection_attempts += 1
+                self.logger.info(f"Reconnecting to {self.server_path} in {delay:.1f}s "
+                                 f"(attempt {self._reconnection_attempts}/{self.MAX_RECONNECTION_ATTEMPTS})")
+                await asyncio.sleep(delay)
+                
+                if await self.connect(self.server_path):
+                    self._reconnection_attempts = 0
+                    return True
+        finally:
+            self.reconnecting = False
+        
+        self.logger.warning("Connection marked as failed - client needs to be reconnected")
+        return False
+    
     async def disconnect(self):
         """Disconnect from the MCP server and clean up resources."""
-        if not self.connected:
+        # A client whose heartbeat is reconnecting is not connected, but must still be stopped
+        if not self.connected and self._heartbeat_task is None:
             return
             
         if not self._manager_task or self._manager_task.done():
             # If there's no manager task running, mark as disconnected directly
+            if self._heartbeat_task:
+                self._heartbeat_task.cancel()
             self.connected = False
             self.session = None
             self.exit_stack = None
@@ -166,6 +283,8 @@ class MCPClient:
         if tool_name not in self.tools:
             raise ValueError(f"Tool '{tool_name}' not found")
         
+        self._last_activity = time.monotonic()
+        
         try:            
             # Execute the tool through the connection manager task
             future = asyncio.Future()
@@ -197,9 +316,14 @@ class MCPClient:
             # Create a new task if needed
             if self._manager_task is None:
                 self.logger.debug("Starting connection manager task")
-                self._manager_task = asyncio.create_task(self._connection_manager_loop())
-                # Name the task for better debugging
-                self._manager_task.set_name(f"mcp_connection_manager_{self.client_id[:8]}")
+                # Started eagerly, so the task already waits on the queue when the first
+                # operation is put, instead of being scheduled one loop iteration later.
+                # Named for better debugging.
+                self._manager_task = asyncio.eager_task_factory(
+                    asyncio.get_running_loop(),
+                    self._connection_manager_loop(),
+                    name=f"mcp_connection_manager_{self.client_id[:8]}"
+                )
 
     async def _connection_manager_loop(self):
         """A dedicated task that handles all connection and disconnection operations.
@@ -216,27 +340,35 @@ class MCPClient:
                 operation, args, future = await self._operation_queue.get()
                 
                 try:
+                    # The caller stopped waiting (e.g. a reconnection cancelled by a disconnect)
+                    if future.cancelled():
+                        self.logger.debug(f"Skipping cancelled operation: {operation}")
+                        continue
+                    
                     self.logger.debug(f"Processing operation: {operation}")
                     if operation == "connect":
                         server_path = args[0]
                         result = await self._internal_connect(server_path)
-                        future.set_result(result)
                     elif operation == "disconnect":
                         await self._internal_disconnect()
-                        future.set_result(None)
+                        result = None
                     elif operation == "execute_tool":
                         tool_name, arguments = args
                         result = await self._internal_execute_tool(tool_name, arguments)
-                        future.set_result(result)
                     elif operation == "get_citations":
                         result = await self._internal_get_citations()
-                        future.set_result(result)
                     else:
                         self.logger.warning(f"Unknown operation: {operation}")
                         future.set_exception(ValueError(f"Unknown operation: {operation}"))
+                        continue
+                    
+                    # The caller may have given up while the operation was running
+                    if not future.done():
+                        future.set_result(result)
                 except Exception as e:
                     self.logger.error(f"Error processing operation {operation}: {e}")
-                    future.set_exception(e)
+                    if not future.done():
+                        future.set_exception(e)
                 finally:
                     self._operation_queue.task_done()
         except asyncio.CancelledError:
@@ -267,7 +399,7 @@ class MCPClient:
         server_params = StdioServerParameters(
             command="python",
             args=[server_path],
-            env=os.environ.copy(),
+            env=_DEFAULT_ENV,
         )
         
         self.logger.debug(f"Connecting to MCP server: {server_path}")
@@ -279,14 +411,19 @@ class MCPClient:
             await session.initialize()
             self.session = session
             self.connected = True
+            self._last_activity = time.monotonic()
             
-            # List available tools
-            response = await self.session.list_tools()
-            tools = response.tools
+            # List available tools, unless this version of the server script was already listed
+            cache_key = self._cache_key()
+            tools = self._TOOL_CACHE.get(cache_key)
+            if tools is None:
+                response = await self.session.list_tools()
+                tools = {tool.name: tool for tool in response.tools}
+                if cache_key is not None:
+                    self._TOOL_CACHE[cache_key] = tools
             
             # Store tools in a dictionary for easy access
-            for tool in tools:
-                self.tools[tool.name] = tool
+            self.tools.update(tools)
             
             self.logger.info(f"Connected to MCP server: {server_path}")
             self.logger.info(f"Discovered {len(self.tools)} tools: {', '.join(self.tools.keys())}")
@@ -312,7 +449,7 @@ class MCPClient:
             
     async def _internal_disconnect(self):
         """Internal disconnect method that runs in the connection manager task."""
-        if not self.connected:
+        if not self.connected and self._heartbeat_task is None:
             return
             
         self.logger.debug(f"Disconnecting from MCP server: {self.server_path} in task {self._connection_task_id}")
@@ -349,7 +486,11 @@ class MCPClient:
         try:
             if self.exit_stack:
                 self.logger.debug("Closing exit stack from the same task that created it")
-                await self.exit_stack.aclose()
+                # Bounded, so a server that does not shut down cannot block reconnections
+                async with asyncio.timeout(5):
+                    await self.exit_stack.aclose()
+        except TimeoutError:
+            self.logger.error(f"Timed out closing the connection to {self.server_path}")
         except asyncio.CancelledError:
             self.logger.warning("Cleanup interrupted by cancellation")
             raise  # Re-raise to allow proper handling
@@ -372,31 +513,75 @@ class MCPClient:
         if tool_name not in self.tools:
             raise ValueError(f"Tool '{tool_name}' not found")
         
+        # The session numbers requests sequentially and call_tool takes its id before
+        # its first suspension, so this is the id of the request sent below
+        request_id = getattr(self.session, "_request_id", None)
+        
+        # Other errors propagate as they are: the connection manager loop logs them
+        # and hands them to the caller
         try:
             # Execute the tool with timeout
-            result = await asyncio.wait_for(
-                self.session.call_tool(name=tool_name, arguments=arguments),
-                timeout=3000  # 3000 second timeout
-            )
-            
-            # Extract the result value from the response object if needed
-            if hasattr(result, 'result'):
-                return result.result
-            else:
-                return result
-                
-        except asyncio.TimeoutError:
+            async with asyncio.timeout(3000):  # 3000 second timeout
+                result = await self.session.call_tool(name=tool_name, arguments=arguments)
+        except TimeoutError:
             self.logger.error(f"Tool execution timed out: {tool_name}")
+            # Let the server know the request was abandoned, so it stops working on it
+            await self._cancel_request(request_id, f"Execution of tool {tool_name} timed out")
             raise TimeoutError(f"Execution of tool {tool_name} timed out after 3000 seconds")
-            
+        
+        # Extract the result value from the response object if needed
+        if hasattr(result, 'result'):
+            return result.result
+        else:
+            return result
+
+    async def _cancel_request(self, request_id: Optional[int], reason: str) -> None:
+        """Send a cancellation notification for a request the client stopped waiting for.
+        
+        Args:
+            request_id (Optional[int]): The JSON-RPC id of the request, None if unknown.
+            reason (str): Why the request was cancelled.
+        """
+        if request_id is None or not self.session:
+            return
+        
+        try:
+            await self.session.send_notification(
+                types.ClientNotification(
+                    types.CancelledNotification(
+                        method="notifications/cancelled",
+                        params=types.CancelledNotificationParams(requestId=request_id, reason=reason)
+                    )
+                )
+            )
         except Exception as e:
-            self.logger.error(f"Error executing tool {tool_name}: {str(e)}")
-            raise
+            self.logger.warning(f"Could not cancel request {request_id}: {e}")
+
+    def _cache_key(self) -> Optional[Tuple[str, float]]:
+        """Get the key of the server script in the class-level caches.
+        
+        The key includes the script's modification time, so editing the server
+        invalidates what was cached for it.
+        
+        Returns:
+            Optional[Tuple[str, float]]: The server path and its modification time,
+                or None if the script cannot be accessed.
+        """
+        try:
+            return (self.server_path, os.path.getmtime(self.server_path))
+        except (OSError, TypeError):
+            return None
 
     async def _internal_get_citations(self) -> Dict[str, str]:
         """Internal get citations method that runs in the connection manager task."""
         if not self.connected or not self.session:
             raise ConnectionError("Not connected to MCP server")
+        
+        # Citations are static for a given server script
+        cache_key = self._cache_key()
+        cached = self._CITATION_CACHE.get(cache_key)
+        if cached is not None:
+            return dict(cached)
             
         citations = {
             "server_name": "None",
@@ -415,28 +600,35 @@ class MCPClient:
             except Exception as e:
                 self.logger.error(f"Failed to get server name: {e}")
                 
-            # Try to read origin citation
-            try:
-                origin_uri = f"citation://origin/{citations['server_name']}"
-                origin_response = await self.session.read_resource(uri=origin_uri)
-                if origin_response and origin_response.contents:
-                    citations["origin"] = origin_response.contents[0].text
-                    self.logger.debug(f"Retrieved origin citation from {origin_uri}")
-            except Exception as e:
-                self.logger.error(f"Failed to get origin citation: {e}")
+            # Read the origin and MCP citations concurrently, they only depend on the server name
+            origin_uri = f"citation://origin/{citations['server_name']}"
+            mcp_uri = f"citation://mcp/{citations['server_name']}"
+            origin_response, mcp_response = await asyncio.gather(
+                self.session.read_resource(uri=origin_uri),
+                self.session.read_resource(uri=mcp_uri),
+                return_exceptions=True
+            )
             
-            # Try to read MCP citation
-            try:
-                mcp_uri = f"citation://mcp/{citations['server_name']}"
-                mcp_response = await self.session.read_resource(uri=mcp_uri)
-                if mcp_response and mcp_response.contents:
-                    citations["mcp"] = mcp_response.contents[0].text
-                    self.logger.debug(f"Retrieved MCP citation from {mcp_uri}")
-            except Exception as e:
-                self.logger.error(f"Failed to get MCP citation: {e}")
+            if isinstance(origin_response, Exception):
+                self.logger.error(f"Failed to get origin citation: {origin_response}")
+            elif origin_response and origin_response.contents:
+                citations["origin"] = origin_response.contents[0].text
+                self.logger.debug(f"Retrieved origin citation from {origin_uri}")
+            
+            if isinstance(mcp_response, Exception):
+                self.logger.error(f"Failed to get MCP citation: {mcp_response}")
+            elif mcp_response and mcp_response.contents:
+                citations["mcp"] = mcp_response.contents[0].text
+                self.logger.debug(f"Retrieved MCP citation from {mcp_uri}")
         
         except Exception as e:
             self.logger.error(f"Error retrieving citations: {e}")
+        
+        # Only cache complete results, so failed reads are retried on the next call
+        if (cache_key is not None and citations["server_name"] != "None"
+                and citations["origin"] != "Citation not available"
+                and citations["mcp"] != "Citation not available"):
+            self._CITATION_CACHE[cache_key] = dict(citations)
             
         return citations
 
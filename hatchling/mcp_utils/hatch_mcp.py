@@ -1,4 +1,5 @@
 import os
+import sys
 import inspect
 import logging
 from typing import Optional
@@ -11,13 +12,16 @@ class HatchMCP():
     def __init__(self, 
                  name: str, 
                  origin_citation: Optional[str] = None, 
-                 mcp_citation: Optional[str] = None):
+                 mcp_citation: Optional[str] = None,
+                 module_file: Optional[str] = None):
         """Initialize the HatchMCP wrapper.
         
         Args:
             name (str): The name of the MCP server.
             origin_citation (str, optional): Citation information for the original tools/algorithms. Defaults to None.
             mcp_citation (str, optional): Citation information for the MCP server implementation. Defaults to None.
+            module_file (str, optional): Path of the server script, usually `__file__`. Defaults to None,
+                in which case the file of the calling module is looked up on the call stack.
         """
         # Initialize the logger
         self.logger = logging_manager.get_session(
@@ -34,20 +38,22 @@ class HatchMCP():
         self._origin_citation = origin_citation or "No origin citation provided."
         self._mcp_citation = mcp_citation or "No MCP citation provided."
 
-        # Determine the filename of the calling module for citation URIs
-        try:
-            frame = inspect.stack()[1]
-            module = inspect.getmodule(frame[0])
-            if module and module.__file__:
-                self.module_name = module.__file__[1:]
-                self.logger.info(f"Module name for citation URIs: {self.module_name}")
-        except Exception:
-            raise RuntimeError("Unable to determine module name for citation URIs.")
+        # Determine the filename of the server module for citation URIs
+        if module_file is None:
+            module_file = self._resolve_module_file()
+        if module_file:
+            self.module_name = os.path.abspath(module_file)[1:]
+            self.logger.info(f"Module name for citation URIs: {self.module_name}")
+        
+        # Build the resource URIs once
+        self.name_uri = f"name://{self.module_name}"
+        self.origin_citation_uri = f"citation://origin/{name}"
+        self.mcp_citation_uri = f"citation://mcp/{name}"
         
         # Register a resource to discover the server name
         # This allows clients to query server_name://hatch to get the correct name for citation URIs
         @self.server.resource(
-            uri=f"name://{self.module_name}",
+            uri=self.name_uri,
             name="Server Name",
             description="The name of this MCP server for use in other resource URIs",
             mime_type="text/plain"
@@ -62,7 +68,7 @@ class HatchMCP():
 
         # Register citation resources using standard URIs and the resource decorator
         @self.server.resource(
-            uri=f"citation://origin/{name}",
+            uri=self.origin_citation_uri,
             name="Origin Citation",
             description="Citation information for the original tools/algorithms",
             mime_type="text/plain"
@@ -76,7 +82,7 @@ class HatchMCP():
             return self._origin_citation
         
         @self.server.resource(
-            uri=f"citation://mcp/{name}",
+            uri=self.mcp_citation_uri,
             name="MCP Implementation Citation",
             description="Citation information for the MCP server implementation",
             mime_type="text/plain"
@@ -88,3 +94,27 @@ class HatchMCP():
                 str: Citation information text.
             """
             return self._mcp_citation
+
+    @staticmethod
+    def _resolve_module_file() -> Optional[str]:
+        """Find the file of the module that created the HatchMCP instance.
+        
+        Only used when no module file is given to the constructor.
+        
+        Returns:
+            Optional[str]: Path of the calling module, or None if it has no file.
+            
+        Raises:
+            RuntimeError: If the calling module cannot be determined.
+        """
+        try:
+            # Skip this helper's frame and the constructor's. Unlike inspect.stack(),
+            # sys._getframe() does not build frame records or read source lines.
+            frame = sys._getframe(2)
+            module = inspect.getmodule(frame)
+        except Exception:
+            raise RuntimeError("Unable to determine module name for citation URIs.")
+        
+        if module and module.__file__:
+            return module.__file__
+        return None
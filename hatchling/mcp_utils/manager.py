@@ -1,13 +1,98 @@
 import asyncio
+import concurrent.futures
 import logging
 import os
 import subprocess
-from typing import Dict, List, Any, Optional
+import threading
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Coroutine, Dict, List, Any, Optional
 
 from hatchling.mcp_utils.client import MCPClient
 from hatchling.mcp_utils.ollama_adapter import OllamaMCPAdapter
 from hatchling.core.logging.logging_manager import logging_manager
 
+class AsyncLoopThread(threading.Thread):
+    """Daemon thread hosting a dedicated asyncio event loop.
+
+    Synchronous callers submit coroutines to this loop instead of spinning up
+    a new loop per call, so all of them share the same MCP connections.
+    """
+
+    def __init__(self, name: str = "mcp_event_loop"):
+        """Initialize the loop thread. The loop is created and the thread started on first submission.
+
+        Args:
+            name (str, optional): Name of the thread. Defaults to "mcp_event_loop".
+        """
+        super().__init__(name=name, daemon=True)
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._start_lock = threading.Lock()
+
+    def run(self) -> None:
+        """Run the event loop forever in this thread."""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro: Coroutine) -> concurrent.futures.Future:
+        """Schedule a coroutine on the background loop.
+
+        Args:
+            coro (Coroutine): The coroutine to run.
+
+        Returns:
+            concurrent.futures.Future: Future holding the result of the coroutine.
+        """
+        with self._start_lock:
+            if self.loop is None:
+                self.loop = asyncio.new_event_loop()
+            if not self.is_alive():
+                self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+class AsyncRWLock:
+    """Lightweight asyncio reader/writer lock.
+
+    Any number of readers may hold the lock at once; a writer waits for the
+    readers to drain and blocks new readers while it waits or holds the lock.
+    Built from an asyncio.Lock, an asyncio.Event and a reader count.
+    """
+
+    def __init__(self):
+        """Initialize the lock in the released state."""
+        self._writer_lock = asyncio.Lock()
+        self._no_readers = asyncio.Event()
+        self._no_readers.set()
+        self._readers = 0
+
+    @property
+    def reader_lock(self):
+        """Async context manager acquiring shared (read) access."""
+        return self._read()
+
+    @property
+    def writer_lock(self):
+        """Async context manager acquiring exclusive (write) access."""
+        return self._write()
+
+    @asynccontextmanager
+    async def _read(self) -> AsyncIterator[None]:
+        # Readers only pass through the writer lock, so they queue behind a pending writer
+        async with self._writer_lock:
+            self._readers += 1
+            self._no_readers.clear()
+        try:
+            yield
+        finally:
+            self._readers -= 1
+            if self._readers == 0:
+                self._no_readers.set()
+
+    @asynccontextmanager
+    async def _write(self) -> AsyncIterator[None]:
+        async with self._writer_lock:
+            await self._no_readers.wait()
+            yield
+
 class MCPManager:
     """Centralized manager for everything MCP-related: servers, clients, and adapters."""
     
@@ -34,8 +119,11 @@ class MCPManager:
         
         # Connection tracking
         self.mcp_clients: Dict[str, MCPClient] = {}
+        self._client_pool: Dict[str, MCPClient] = {}  # Every client ever created, reused on reconnect
         self.server_processes: Dict[str, subprocess.Popen] = {}
-        self._connection_lock = asyncio.Lock()
+        self.SERVER_START_GRACE = 1  # seconds a started server must stay up to count as running
+        # Tool executions share the lock, connect/disconnect take it exclusively
+        self._rwlock = AsyncRWLock()
         self.connected = False
         
         # Tool tracking
@@ -47,6 +135,11 @@ class MCPManager:
         # Adapter for Ollama format
         self._adapter = None
         
+        # Shared background loop for synchronous callers (see *_sync methods)
+        self._loop_thread = AsyncLoopThread()
+        # Loop the clients were connected on: their queues, futures and tasks only work there
+        self._bound_loop: Optional[asyncio.AbstractEventLoop] = None
+        
         # Get a debug log session
         self.logger = logging_manager.get_session(self.__class__.__name__,
                                   formatter=logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
@@ -105,14 +198,63 @@ class MCPManager:
             # Store the process
             self.server_processes[server_path] = process
             
-            # Give the MCP server a moment to start
-            await asyncio.sleep(2)
+            # Drain the output in the background so the pipe never fills up. Stdio MCP
+            # servers print nothing until they get a request, so a server counts as
+            # running once it has not exited within the grace period.
+            loop = asyncio.get_running_loop()
+            output_closed = loop.create_future()
+            threading.Thread(
+                target=self._drain_server_output,
+                args=(server_path, process, loop, output_closed),
+                name=f"mcp_server_output_{server_filename}",
+                daemon=True
+            ).start()
+            
+            try:
+                await asyncio.wait_for(output_closed, timeout=self.SERVER_START_GRACE)
+                # The output closes as the process exits: let it finish exiting
+                await asyncio.to_thread(process.wait, self.SERVER_START_GRACE)
+            except (asyncio.TimeoutError, subprocess.TimeoutExpired):
+                pass
+            
+            if process.poll() is not None:
+                self.logger.error(f"MCP server exited during startup with code {process.returncode}: {server_path}")
+                del self.server_processes[server_path]
+                return None
             
             return process
         except Exception as e:
             self.logger.error(f"Error starting MCP server: {str(e)}")
             return None
     
+    def _drain_server_output(self, server_path: str, process: subprocess.Popen,
+                             loop: asyncio.AbstractEventLoop, output_closed: asyncio.Future) -> None:
+        """Consume a server's output until EOF. Runs in a daemon thread.
+        
+        Args:
+            server_path (str): Path to the MCP server script, used in log messages.
+            process (subprocess.Popen): The server process whose stdout is drained.
+            loop (asyncio.AbstractEventLoop): Loop owning output_closed.
+            output_closed (asyncio.Future): Resolved once the output reaches EOF.
+        """
+        def resolve() -> None:
+            if not output_closed.done():
+                output_closed.set_result(None)
+        
+        server_filename = os.path.basename(server_path)
+        try:
+            for line in process.stdout:
+                self.logger.debug("[%s] %s", server_filename, line.rstrip())
+        except (OSError, ValueError):
+            # Pipe closed underneath us
+            pass
+        finally:
+            try:
+                loop.call_soon_threadsafe(resolve)
+            except RuntimeError:
+                # The event loop is already gone
+                pass
+    
     async def initialize(self, server_paths: List[str], auto_start: bool = False) -> bool:
         """Initialize the MCP system with the given server paths.
         
@@ -131,6 +273,42 @@ class MCPManager:
             
         return connected
 
+    def initialize_sync(self, server_paths: List[str], auto_start: bool = False) -> bool:
+        """Synchronous counterpart of initialize() running on the shared background loop.
+
+        Must not be called from a thread that is already running an event loop,
+        and must not be mixed with the async API driven from another loop.
+
+        Args:
+            server_paths (List[str]): List of paths to MCP server scripts.
+            auto_start (bool, optional): Whether to start servers if they aren't running. Defaults to False.
+            
+        Returns:
+            bool: True if initialization was successful.
+            
+        Raises:
+            RuntimeError: If the servers were connected from another event loop.
+        """
+        return self._run_sync(self.initialize(server_paths, auto_start))
+    
+    def _run_sync(self, coro: Coroutine) -> Any:
+        """Run a coroutine on the shared background loop and wait for its result.
+        
+        Args:
+            coro (Coroutine): The coroutine to run.
+            
+        Returns:
+            Any: Result of the coroutine.
+            
+        Raises:
+            RuntimeError: If the servers were connected from another event loop.
+        """
+        if self._bound_loop is not None and self._bound_loop is not self._loop_thread.loop:
+            coro.close()
+            raise RuntimeError("MCP servers were connected from another event loop: "
+                               "use the async methods from that loop instead of the *_sync ones")
+        return self._loop_thread.submit(coro).result()
+
     async def connect_to_servers(self, server_paths: List[str], auto_start: bool = False) -> bool:
         """Connect to all configured MCP servers.
         
@@ -144,28 +322,44 @@ class MCPManager:
         if self.connected and self.mcp_clients:
             return True
             
-        async with self._connection_lock:
+        async with self._rwlock.writer_lock:
             # Validate server paths
             valid_paths = self.validate_server_paths(server_paths)
             if not valid_paths:
                 self.logger.error("No valid MCP server scripts found")
                 return False
             
-            # Connect to each valid server path
-            for path in valid_paths:
-                # Start the server if requested
-                if auto_start and path not in self.server_processes:
-                    await self.start_server(path)
+            # Start the servers if requested
+            if auto_start:
+                for path in valid_paths:
+                    if path not in self.server_processes:
+                        await self.start_server(path)
+            
+            # Nothing to do for the servers that are still connected
+            paths_to_connect = [
+                path for path in valid_paths
+                if not (path in self.mcp_clients and self.mcp_clients[path].connected)
+            ]
+            
+            # Connect to the servers concurrently. Each connection starts eagerly, so it
+            # spawns its server before the next one is even created.
+            loop = asyncio.get_running_loop()
+            results = await asyncio.gather(
+                *(asyncio.eager_task_factory(loop, self._connect_client(path), name=f"mcp_connect_{path}")
+                  for path in paths_to_connect),
+                return_exceptions=True
+            )
+            
+            # Register the connected clients in order, so later servers still take
+            # precedence for tools with the same name
+            for path, client in zip(paths_to_connect, results):
+                if isinstance(client, BaseException):
+                    self.logger.error(f"Failed to connect to MCP server at {path}: {client}")
+                    continue
+                if client is None:
+                    continue
                 
-                # Connect to the server
-                client = MCPClient()
-                is_connected = await client.connect(path)
-                if is_connected:
-                    self.mcp_clients[path] = client
-                    
-                    # Cache tool mappings
-                    for tool_name in client.tools:
-                        self._tool_client_map[tool_name] = client
+                self._register_client(path, client)
             
             # Update connection status
             self.connected = len(self.mcp_clients) > 0
@@ -182,20 +376,62 @@ class MCPManager:
                 self.logger.warning("Failed to connect to any MCP server")
                 
             return self.connected
+    def _register_client(self, path: str, client: MCPClient) -> None:
+        """Track a connected client and map its tools to it.
+        
+        Args:
+            path (str): Path to the MCP server script.
+            client (MCPClient): The connected client.
+        """
+        self.mcp_clients[path] = client
+        
+        # Cache tool mappings
+        for tool_name in client.tools:
+            self._tool_client_map[tool_name] = client
+    
+    async def _connect_client(self, path: str) -> Optional[MCPClient]:
+        """Connect the pooled client of a server, creating the client if needed.
+        
+        Args:
+            path (str): Path to the MCP server script.
+            
+        Returns:
+            Optional[MCPClient]: The connected client, or None if the connection failed.
+            
+        Raises:
+            RuntimeError: If other clients were connected from another event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._bound_loop is None:
+            self._bound_loop = loop
+        elif self._bound_loop is not loop:
+            raise RuntimeError("MCP servers were already connected from another event loop")
+        
+        client = self._client_pool.get(path)
+        if client is None:
+            client = self._client_pool[path] = MCPClient()
+        
+        if await client.connect(path):
+            return client
+        return None
+    
     async def disconnect_all(self) -> None:
         """Disconnect from all MCP servers."""
-        if not self.connected:
+        if not self._client_pool:
             return
             
-        async with self._connection_lock:
+        async with self._rwlock.writer_lock:
             # Store the current task for debugging
             current_task_id = id(asyncio.current_task())
             self.logger.debug(f"Disconnecting all clients from task: {current_task_id}")
             
             disconnection_errors = False
             
-            # First try the graceful disconnect approach
-            for path, client in list(self.mcp_clients.items()):
+            # First try the graceful disconnect approach. Go through every client ever
+            # created, not only the registered ones: a client dropped from the maps may
+            # still be connected, or reconnecting from its heartbeat.
+            # No snapshot needed: the writer lock keeps the pool stable.
+            for path, client in self._client_pool.items():
                 try:
                     # Log task context for debugging
                     if hasattr(client, '_connection_task_id') and client._connection_task_id:
@@ -227,6 +463,17 @@ class MCPManager:
             self.connected = False
             self.logger.info("Disconnected from all MCP servers")
     
+    def disconnect_all_sync(self) -> None:
+        """Synchronous counterpart of disconnect_all() running on the shared background loop.
+        
+        Must not be called from a thread that is already running an event loop,
+        and must not be mixed with the async API driven from another loop.
+        
+        Raises:
+            RuntimeError: If the servers were connected from another event loop.
+        """
+        self._run_sync(self.disconnect_all())
+    
     def _terminate_server_processes(self) -> None:
         """Terminate all server processes directly.
         This is a fallback mechanism when graceful disconnection fails.
@@ -294,49 +541,86 @@ class MCPManager:
             ConnectionError: If not connected to any MCP server.
             ValueError: If the tool is not found in any connected MCP server.
         """
-        if not self.connected or not self.mcp_clients:
-            raise ConnectionError("Not connected to any MCP server")
-            
-        if tool_name not in self._tool_client_map:
-            raise ValueError(f"Tool '{tool_name}' not found in any connected MCP server")
-            
-        client = self._tool_client_map[tool_name]
-        self._used_servers_in_session.add(client.server_path)
+        # Only the lookup needs the lock: holding it during the call would make connects
+        # and disconnects, and every tool call queued behind them, wait for slow tools
+        async with self._rwlock.reader_lock:
+            if not self.connected or not self.mcp_clients:
+                raise ConnectionError("Not connected to any MCP server")
+                
+            if tool_name not in self._tool_client_map:
+                raise ValueError(f"Tool '{tool_name}' not found in any connected MCP server")
+                
+            client = self._tool_client_map[tool_name]
+            self._used_servers_in_session.add(client.server_path)
         
         try:
             return await client.execute_tool(tool_name, arguments)
         except ConnectionError:
-            # Handle client disconnection
-            for path, c in list(self.mcp_clients.items()):
-                if c == client:
+            # A client whose heartbeat is reconnecting stays registered, so its tools
+            # are reachable again once the connection is restored
+            if client.reconnecting:
+                raise
+            
+            # Handle client disconnection: clients are keyed by their server path
+            async with self._rwlock.writer_lock:
+                if self.mcp_clients.get(client.server_path) is client:
                     # Remove the disconnected client
-                    del self.mcp_clients[path]
-                    # Clean up tool mappings
-                    self._tool_client_map = {
-                        name: c for name, c in self._tool_client_map.items() 
-                        if c != client
-                    }
-                    break
+                    del self.mcp_clients[client.server_path]
+                    # Clean up tool mappings in place
+                    for name in [n for n, c in self._tool_client_map.items() if c is client]:
+                        del self._tool_client_map[name]
             
             # Re-raise the exception
             raise
     
+    def execute_tool_sync(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        """Synchronous counterpart of execute_tool() running on the shared background loop.
+
+        Concurrent callers from several threads are multiplexed on the same loop.
+        Must not be called from a thread that is already running an event loop,
+        and must not be mixed with the async API driven from another loop.
+        
+        Args:
+            tool_name (str): Name of the tool to execute.
+            arguments (Dict[str, Any]): Arguments to pass to the tool.
+            
+        Returns:
+            Any: Result of the tool execution.
+            
+        Raises:
+            RuntimeError: If the servers were connected from another event loop.
+        """
+        return self._run_sync(self.execute_tool(tool_name, arguments))
+    
     async def get_citations_for_session(self) -> Dict[str, Dict[str, str]]:
         """Get citations for all servers used in the current session.
+        
+        The servers are queried concurrently; each client caches its server's
+        citations, so repeated calls do not reach the servers again.
 
         Returns:
             Dict[str, Dict[str, str]]: Dictionary of citations for each server.
         """
         citations = {}
         
-        for path in self._used_servers_in_session:
-            if path in self.mcp_clients:
-                client = self.mcp_clients[path]
-                try:
-                    server_citations = await client.get_citations()
-                    citations[path] = server_citations
-                except Exception as e:
-                    self.logger.error(f"Error getting citations for {path}: {e}")
+        # Only take the snapshot of the clients under the lock, not the server round-trips
+        async with self._rwlock.reader_lock:
+            to_fetch = [
+                (path, self.mcp_clients[path])
+                for path in self._used_servers_in_session
+                if path in self.mcp_clients
+            ]
+        
+        results = await asyncio.gather(
+            *(client.get_citations() for _, client in to_fetch),
+            return_exceptions=True
+        )
+        
+        for (path, _), result in zip(to_fetch, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error getting citations for {path}: {result}")
+                continue
+            citations[path] = result
         
         return citations
 
@@ -362,7 +646,8 @@ class MCPManager:
     
     def stop_all_servers(self) -> None:
         """Stop all running MCP server processes."""
-        for path, process in list(self.server_processes.items()):
+        for path in list(self.server_processes.keys()):
+            process = self.server_processes[path]
             if process.poll() is None:  # Process is still running
                 try:
                     process.terminate()
@@ -11,6 +11,7 @@ class OllamaMCPAdapter:
         """Initialize the adapter."""
         # Schema caching for better performance and parameter name consistency
         self._mcp_to_ollama_schemas = {}  # Cache for MCP schemas converted to Ollama format
+        self._cached_tool_list = []  # Values of the cache above, as returned by get_all_tools
         
         # Get a debug log session from the logging_manager
         self.logger = logging_manager.get_session(self.__class__.__name__,
@@ -19,33 +20,43 @@ class OllamaMCPAdapter:
     async def build_schema_cache(self, mcp_tools: Dict[str, Any]) -> None:
         """Build cache of Ollama tool schemas based on the schemas of MCP tools.
         
+        The conversion runs in a worker thread so large tool catalogs don't stall
+        the event loop, and the new cache replaces the old one in a single swap.
+        
         Args:
             mcp_tools (Dict[str, Any]): Dictionary of MCP tools to convert.
         """
         try:
-            # Clear existing caches
-            self._mcp_to_ollama_schemas = {}
+            new_cache = await asyncio.to_thread(self._build_schema_cache_sync, mcp_tools)
             
-            # Build the schema cache
-            for tool_name, tool in mcp_tools.items():
-                # Extract the schema from the tool
-                tool_schema = self._extract_MCPTool_schema_in_Ollama(tool)
-                    
-                # Convert MCP schema to Ollama format
-                ollama_schema = {
-                    "type": "function",
-                    "function": tool_schema
-                }
- 
-                # Cache the Ollama schema
-                self._mcp_to_ollama_schemas[tool_name] = ollama_schema
+            # Swap both views at once so readers never see a half-built cache
+            self._mcp_to_ollama_schemas = new_cache
+            self._cached_tool_list = list(new_cache.values())
 
-            self.logger.debug(f"Built schema cache for {len(self._mcp_to_ollama_schemas)} tools")
+            self.logger.debug(f"Built schema cache for {len(new_cache)} tools")
             
         except Exception as e:
             self.logger.error(f"Error building tool schema cache: {e}")
             # Don't re-raise, as this is a non-critical error that shouldn't halt execution
     
+    def _build_schema_cache_sync(self, mcp_tools: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Convert MCP tools to Ollama schemas.
+        
+        Args:
+            mcp_tools (Dict[str, Any]): Dictionary of MCP tools to convert.
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Ollama schemas keyed by tool name.
+        """
+        cache = {}
+        for tool_name, tool in mcp_tools.items():
+            # Extract the schema from the tool and wrap it in Ollama's format
+            cache[tool_name] = {
+                "type": "function",
+                "function": self._extract_MCPTool_schema_in_Ollama(tool)
+            }
+        return cache
+    
     def _extract_MCPTool_schema_in_Ollama(self, tool) -> Dict[str, Any]:
         """Extract schema from an MCP tool object.
         
@@ -73,12 +84,13 @@ class OllamaMCPAdapter:
         Returns:
             List[Dict[str, Any]]: List of tools in Ollama format.
         """
-        if not self._mcp_to_ollama_schemas:
+        tools = self._cached_tool_list
+        if not tools:
             self.logger.warning("No tools available in schema cache")
             return []
             
-        self.logger.debug(f"Returning {len(self._mcp_to_ollama_schemas)} tools from schema cache")
-        return list(self._mcp_to_ollama_schemas.values())
+        self.logger.debug(f"Returning {len(tools)} tools from schema cache")
+        return tools
 
     async def process_tool_calls(self, tool_calls: List[Dict[str, Any]], manager) -> List[Dict[str, Any]]:
         """Process Ollama tool calls and execute them using MCP.
@@ -115,7 +127,7 @@ class OllamaMCPAdapter:
         function_call = tool_call.get("function", {})
         function_name = function_call.get("name", "")
         
-        self.logger.debug(f"Processing tool call: {function_name}")
+        self.logger.debug("Processing tool call: %s", function_name)
         
         # Parse arguments (safely)
         try:
@@ -134,7 +146,7 @@ class OllamaMCPAdapter:
         
         try:
             # Execute the tool using the manager
-            self.logger.debug(f"Executing tool {function_name} with arguments: {arguments}")
+            self.logger.debug("Executing tool %s with arguments: %s", function_name, arguments)
             result = await manager.execute_tool(function_name, arguments)
             
         except ValueError as param_error:
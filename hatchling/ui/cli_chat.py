@@ -4,29 +4,61 @@ import asyncio
 import subprocess
 import re
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 from prompt_toolkit import PromptSession, print_formatted_text as print_pt
-from prompt_toolkit.history import FileHistory, InMemoryHistory
+from prompt_toolkit.history import InMemoryHistory
 from prompt_toolkit.patch_stdout import patch_stdout
 from prompt_toolkit.formatted_text import FormattedText
 from prompt_toolkit.styles import Style
 
 from hatchling.core.logging.logging_manager import logging_manager
+from hatchling.core.logging.logging_config import set_prompt_active
 from hatchling.core.llm.model_manager import ModelManager
 from hatchling.core.llm.chat_session import ChatSession
 from hatchling.core.chat.chat_command_handler import ChatCommandHandler
 from hatchling.core.chat.command_completion import CommandCompleterFactory
 from hatchling.core.chat.command_lexer import ChatCommandLexer
+from hatchling.core.chat.input_history import AsyncBufferedFileHistory
 from hatchling.config.settings import ChatSettings
 from hatchling.mcp_utils.manager import mcp_manager
 # Import removed - using centralized logging system
 
 from hatch import HatchEnvironmentManager
 
+# Command styling for both help display and real-time input highlighting
+_COMMAND_STYLE_DICT = {
+    # Help display styles
+    'command.name': 'bold #44ff00',          # Green bold for command names
+    'command.description': "#ffffff",        # White for descriptions
+    'command.args': 'italic #87afff',        # Light blue italic for arguments
+    'header': 'bold #ff9d00 underline',      # Orange underline for headers
+
+    # Group specific styles for help
+    'command.name.hatch': 'bold #00b7c3',    # Teal for Hatch commands
+    'command.name.base': 'bold #44ff00',     # Green for base commands
+    'group.default': '',                     # Default group style
+    
+    # Real-time input highlighting styles
+    'command.args.base': 'bold #87afff',     # Base command arguments - blue
+    'command.args.hatch': 'bold #00b7c3',    # Hatch command arguments - teal
+    'command.args.invalid': '#ff6b6b',       # Invalid arguments - red
+    'command.value.path': '#ffb347',         # Path values - orange
+    'command.value.number': '#98fb98',       # Number values - light green
+    'command.value.string': '#dda0dd',       # String values - plum
+    'command.value.generic': '#f0f0f0',      # Generic values - light gray
+    'text.default': '#ffffff',               # Default text - white
+}
+
 class CLIChat:
     """Command-line interface for chat functionality."""    
     
+    # Parsed once per process and shared by all instances
+    _COMMAND_STYLE = Style.from_dict(_COMMAND_STYLE_DICT)
+    
+    # Printed by the chat session along with the first token of each answer
+    _ASSISTANT_PREFIX = FormattedText([('green', '\nAssistant: ')])
+    
     def __init__(self, settings: ChatSettings):
         """Initialize the CLI chat interface.
         
@@ -46,48 +78,65 @@ class CLIChat:
         # Setup persistent history with 500 entries limit
         try:
             self.prompt_session = PromptSession(
-                history=FileHistory(str(history_dir / '.user_inputs')))
+                history=AsyncBufferedFileHistory(str(history_dir / '.user_inputs'), max_entries=500))
         except (IOError, OSError) as e:
             self.logger.warning(f"Could not create history file: {e}")
             self.logger.warning("Falling back to in-memory history")
             self.prompt_session = PromptSession(history=InMemoryHistory())
         
-        # Define command styling for both help display and real-time input highlighting
-        self.command_style = Style.from_dict({
-            # Help display styles
-            'command.name': 'bold #44ff00',          # Green bold for command names
-            'command.description': "#ffffff",        # White for descriptions
-            'command.args': 'italic #87afff',        # Light blue italic for arguments
-            'header': 'bold #ff9d00 underline',      # Orange underline for headers
-
-            # Group specific styles for help
-            'command.name.hatch': 'bold #00b7c3',    # Teal for Hatch commands
-            'command.name.base': 'bold #44ff00',     # Green for base commands
-            'group.default': '',                     # Default group style
-            
-            # Real-time input highlighting styles
-            'command.name': 'bold #44ff00',          # Command names - bright green
-            'command.args.base': 'bold #87afff',     # Base command arguments - blue
-            'command.args.hatch': 'bold #00b7c3',    # Hatch command arguments - teal
-            'command.args.invalid': '#ff6b6b',       # Invalid arguments - red
-            'command.value.path': '#ffb347',         # Path values - orange
-            'command.value.number': '#98fb98',       # Number values - light green
-            'command.value.string': '#dda0dd',       # String values - plum
-            'command.value.generic': '#f0f0f0',      # Generic values - light gray
-            'text.default': '#ffffff',               # Default text - white
-        })
+        # Command styling for both help display and real-time input highlighting
+        self.command_style = CLIChat._COMMAND_STYLE
+        
+        # Hatch environment manager, created on first use since it scans the environments directory
+        self._env_manager: Optional[HatchEnvironmentManager] = None
+        
+        # MCP server entry points per Hatch environment name, reused when initializing again
+        self._entry_points_by_env: Dict[str, List[str]] = {}
         
-        self.env_manager = HatchEnvironmentManager(
-            environments_dir = self.settings.hatch_envs_dir,
-            cache_ttl = 86400,  # 1 day default
-        )
-            
         # Create the model manager
         self.model_manager = ModelManager(settings, self.logger)
         
         # Chat session will be initialized during startup
         self.chat_session = None
         self.cmd_handler = None
+        
+        # HTTP session shared by every call to the LLM provider, created lazily
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    @property
+    def env_manager(self) -> HatchEnvironmentManager:
+        """The Hatch environment manager, created on first access.
+        
+        Returns:
+            HatchEnvironmentManager: The Hatch environment manager.
+        """
+        if self._env_manager is None:
+            self._env_manager = HatchEnvironmentManager(
+                environments_dir = self.settings.hatch_envs_dir,
+                cache_ttl = 86400,  # 1 day default
+            )
+        return self._env_manager
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it if needed.
+        
+        Returns:
+            aiohttp.ClientSession: The session to use for API calls.
+        """
+        if self._session is None or self._session.closed:
+            # All traffic goes to a single LLM host: keep a small pool of warm
+            # connections pinned to it and cache its DNS resolution
+            connector = aiohttp.TCPConnector(
+                limit=8,
+                limit_per_host=8,
+                keepalive_timeout=75,
+                ttl_dns_cache=600,
+                enable_cleanup_closed=True
+            )
+            # Fail fast when the host is unreachable, but never time out streamed responses
+            timeout = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=None)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self._session
     
     async def initialize(self) -> bool:
         """Initialize the chat environment.
@@ -100,37 +149,36 @@ class CLIChat:
         print_pt(FormattedText([
             ('yellow bold', f"\nUsing LLM provider: {provider} (model: {model})\n")
         ]))
+        # Check the service with the shared HTTP session, so its connection is reused by the chat
+        session = await self._get_session()
         if provider == "ollama":
-            available, message = await self.model_manager.check_ollama_service()
-            if not available:
-                self.logger.error(message)
-                self.logger.error(
-                    f"Please ensure the Ollama service is running at {self.settings.ollama_api_url} before running this script."
-                )
-                print_pt(FormattedText([('red bold', message)]))
-                return False
-            self.logger.info(message)
-            print_pt(FormattedText([('green', message)]))
+            service_check = self.model_manager.check_ollama_service(session)
         elif provider == "openai":
-            available, message = await self.model_manager.check_openai_service()
-            if not available:
-                self.logger.error(message)
-                print_pt(FormattedText([('red bold', message)]))
-                return False
-            self.logger.info(message)
-            print_pt(FormattedText([('green', message)]))
+            service_check = self.model_manager.check_openai_service(session)
         else:
             msg = f"Unknown LLM provider: {provider}"
             self.logger.error(msg)
             print_pt(FormattedText([('red bold', msg)]))
             return False
         
-        # Check if MCP server is available
+        # The provider check is network I/O and the environment lookup is disk I/O,
+        # so run them concurrently
         self.logger.info("Checking MCP server availability...")
-        # Get the name of the current environment
-        name = self.env_manager.get_current_environment()
-        # Retrieve the environment's entry points for the MCP servers
-        mcp_servers_url = self.env_manager.get_servers_entry_points(name)
+        (available, message), mcp_servers_url = await asyncio.gather(
+            service_check,
+            asyncio.to_thread(self._get_mcp_servers_entry_points)
+        )
+        if not available:
+            self.logger.error(message)
+            if provider == "ollama":
+                self.logger.error(
+                    f"Please ensure the Ollama service is running at {self.settings.ollama_api_url} before running this script."
+                )
+            print_pt(FormattedText([('red bold', message)]))
+            return False
+        self.logger.info(message)
+        print_pt(FormattedText([('green', message)]))
+        
         mcp_available = await mcp_manager.initialize(mcp_servers_url)
         if mcp_available:
             self.logger.info("MCP server is available! Tool calling is ready to use.")
@@ -150,8 +198,31 @@ class CLIChat:
         all_commands = self.cmd_handler.get_all_command_metadata()
         self.command_lexer = ChatCommandLexer(all_commands)
         
+        # Build the two possible input prompts once
+        self._prompt_tools_enabled = FormattedText([
+            ('fg:#5fafff  bold', '[Tools enabled]'), #aqua pearl
+            ('', ' You: ')
+        ])
+        self._prompt_tools_disabled = FormattedText([
+            ('fg:#005f5f', '[Tools disabled]'), #very dark cyan
+            ('', ' You: ')
+        ])
+        
         return True
     
+    def _get_mcp_servers_entry_points(self) -> List[str]:
+        """Get the MCP server entry points of the current Hatch environment.
+        
+        Returns:
+            List[str]: Paths to the MCP server scripts.
+        """
+        # Get the name of the current environment
+        name = self.env_manager.get_current_environment()
+        # Retrieve the environment's entry points for the MCP servers, once per environment
+        if name not in self._entry_points_by_env:
+            self._entry_points_by_env[name] = self.env_manager.get_servers_entry_points(name)
+        return self._entry_points_by_env[name]
+    
     async def check_and_pull_model(self, session: aiohttp.ClientSession) -> bool:
         """Check if the model is available and pull it if necessary.
         
@@ -165,15 +236,8 @@ class CLIChat:
             return True
 
         try:
-            # Check if model is available
-            is_model_available = await self.model_manager.check_availability(session, self.settings.ollama_model)
-
-            if is_model_available:
-                self.logger.info(f"Model {self.settings.ollama_model} is already pulled.")
-                return True
-            else:
-                await self.model_manager.pull_model(session, self.settings.ollama_model)
-                return True
+            # Use the local model if present, pull it only when missing
+            return await self.model_manager.ensure_model(session, self.settings.ollama_model)
         except Exception as e:
             self.logger.error(f"Error checking/pulling model: {e}")
             return False
@@ -203,59 +267,66 @@ class CLIChat:
         print_pt(FormattedText([('cyan bold', '\n=== Hatchling Chat Interface ===\n')]))
         self.cmd_handler.print_commands_help()
         
-        async with aiohttp.ClientSession() as session:
-            # Check and pull the model if needed
-            if not await self.check_and_pull_model(session):
-                self.logger.error("Failed to ensure model availability")
-                return
-              # Start the interactive chat loop
-            while True: 
+        session = await self._get_session()
+        
+        # Check and pull the model if needed
+        if not await self.check_and_pull_model(session):
+            self.logger.error("Failed to ensure model availability")
+            return
+        
+        # Resolve the attributes used on every turn once, outside the loop
+        tool_executor = self.chat_session.tool_executor
+        prompt_async = self.prompt_session.prompt_async
+        process_command = self.cmd_handler.process_command
+        send_message = self.chat_session.send_message
+        
+        # Start the interactive chat loop
+        while True:
+            try:
+                # Get user input with prompt_toolkit with a styled prompt
+                if tool_executor.tools_enabled:
+                    prompt_message = self._prompt_tools_enabled
+                else:
+                    prompt_message = self._prompt_tools_disabled
+                
+                set_prompt_active(True)
                 try:
-                    # Get user input with prompt_toolkit with a styled prompt
-                    if self.chat_session.tool_executor.tools_enabled:
-                        status_style = ('fg:#5fafff  bold', '[Tools enabled]') #aqua pearl
-                    else:
-                        status_style = ('fg:#005f5f', '[Tools disabled]') #very dark cyan
-                    
-                    # Create formatted prompt
-                    prompt_message = [
-                        status_style,
-                        ('', ' You: ')
-                    ]
                     # Use patch_stdout to prevent output interference
                     with patch_stdout():
-                        user_message = await self.prompt_session.prompt_async(
-                            FormattedText(prompt_message),
+                        user_message = await prompt_async(
+                            prompt_message,
                             completer=self.command_completer,
                             lexer=self.command_lexer,
                             style=self.command_style
                         )
-                    
-                    # Process as command if applicable
-                    is_command, should_continue = await self.cmd_handler.process_command(user_message)
-                    if is_command:
-                        if not should_continue:
-                            break
-                        continue
-                    
-                    # Handle normal message
-                    if not user_message.strip():
-                        # Skip empty input
-                        continue
-                      # Send the query
-                    print_pt(FormattedText([('green', '\nAssistant: ')]), end='', flush=True)
-                    await self.chat_session.send_message(user_message, session)
-                    # Try to open image if the assistant's last response contains a PNG path
-                    if hasattr(self.chat_session, 'last_response_text'):
-                        self.try_open_image(self.chat_session.last_response_text)
-                    print_pt('')  # Add an extra newline for readability
-                except KeyboardInterrupt:
-                    print_pt(FormattedText([('red', '\nInterrupted. Ending chat session...')]))
-                    break
-                except Exception as e:
-                    self.logger.error(f"Error: {e}")
-                    print_pt(FormattedText([('red', f'\nError: {e}')]))
-    
+                finally:
+                    set_prompt_active(False)
+                
+                # Skip empty input before it reaches the command dispatch
+                user_message = user_message.strip()
+                if not user_message:
+                    continue
+                
+                # Process as command if applicable
+                is_command, should_continue = await process_command(user_message)
+                if is_command:
+                    if not should_continue:
+                        break
+                    continue
+                
+                # Send the query
+                await send_message(user_message, session, prefix=self._ASSISTANT_PREFIX)
+                # Try to open image if the assistant's last response contains a PNG path
+                if hasattr(self.chat_session, 'last_response_text'):
+                    self.try_open_image(self.chat_session.last_response_text)
+                print_pt('')  # Add an extra newline for readability
+            except KeyboardInterrupt:
+                print_pt(FormattedText([('red', '\nInterrupted. Ending chat session...')]))
+                break
+            except Exception as e:
+                self.logger.error(f"Error: {e}")
+                print_pt(FormattedText([('red', f'\nError: {e}')]))
+
     async def initialize_and_run(self) -> None:
         """Initialize the environment and run the interactive chat session."""
         try:
@@ -272,6 +343,14 @@ class CLIChat:
             return
         
         finally:
-            # Clean up any remaining MCP server processes
-            # We disconnect by default after checking MCP availability
+            # Write any input history still queued in memory
+            history = self.prompt_session.history
+            if isinstance(history, AsyncBufferedFileHistory):
+                await history.flush()
+            
+            # Close the shared HTTP session
+            if self._session and not self._session.closed:
+                await self._session.close()
+            
+            # MCP connections are kept open for the whole session: close them now
             await mcp_manager.disconnect_all()
\ No newline at end of file